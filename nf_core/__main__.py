@@ -11,10 +11,8 @@ import rich.traceback
 import rich_click as click
 
 from nf_core import __version__
-from nf_core.download import DownloadError
-from nf_core.modules.modules_repo import NF_CORE_MODULES_REMOTE
-from nf_core.params_file import ParamsFileBuilder
-from nf_core.utils import check_if_outdated, rich_force_colors, setup_nfcore_dir
+from nf_core.synced_repo import NF_CORE_MODULES_REMOTE
+from nf_core.utils import check_if_outdated, rich_force_colors, setup_nfcore_dir, setup_requests_cachedir
 
 # Set up logging as the root logger
 # Submodules should all traverse back to this
@@ -74,6 +72,8 @@ rich.traceback.install(console=stderr, width=200, word_wrap=True, extra_lines=1)
 # because they are actually preliminary, but intended program terminations.
 # (Custom exceptions are cleaner than `sys.exit(1)`, which we used before)
 def selective_traceback_hook(exctype, value, traceback):
+    from nf_core.download import DownloadError
+
     if exctype in {DownloadError}:  # extend set as needed
         log.error(value)
     else:
@@ -85,6 +85,8 @@ sys.excepthook = selective_traceback_hook
 
 
 def run_nf_core():
+    # Cache web requests between runs, including the version check below
+    setup_requests_cachedir()
     # print nf-core header if environment variable is not set
     if os.environ.get("_NF_CORE_COMPLETE") is None:
         # Print nf-core header
@@ -250,6 +252,8 @@ def create_params_file(pipeline, revision, output, force, show_hidden):
     Run using a remote pipeline name (such as GitHub `user/repo` or a URL),
     a local pipeline directory.
     """
+    from nf_core.params_file import ParamsFileBuilder
+
     builder = ParamsFileBuilder(pipeline, revision)
 
     if not builder.write_params_file(output, show_hidden=show_hidden, force=force):
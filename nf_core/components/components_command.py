@@ -4,8 +4,6 @@ import os
 import shutil
 from pathlib import Path
 
-import yaml
-
 import nf_core.utils
 from nf_core.modules.modules_json import ModulesJson
 from nf_core.modules.modules_repo import ModulesRepo
@@ -111,15 +109,16 @@ class ComponentCommand:
 
         try:
             shutil.rmtree(component_dir)
-            # remove all empty directories
-            for dir_path, dir_names, filenames in os.walk(self.dir, topdown=False):
-                if not dir_names and not filenames:
-                    try:
-                        os.rmdir(dir_path)
-                    except OSError:
-                        pass
-                    else:
-                        log.debug(f"Deleted  directory: '{dir_path}'")
+            # remove the parent directories that are left empty, up to the modules/subworkflows directory
+            components_dir = Path(self.dir, self.component_type).resolve()
+            dir_path = Path(component_dir).resolve().parent
+            while components_dir in dir_path.parents:
+                try:
+                    dir_path.rmdir()
+                except OSError:
+                    break
+                log.debug(f"Deleted  directory: '{dir_path}'")
+                dir_path = dir_path.parent
 
             log.debug(f"Successfully removed {self.component_type[:-1]} {component_name}")
             return True
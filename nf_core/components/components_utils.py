@@ -1,5 +1,4 @@
 import logging
-import os
 import re
 from pathlib import Path
 
@@ -10,6 +9,11 @@ import nf_core.utils
 
 log = logging.getLogger(__name__)
 
+# Matches the include statements of a subworkflow, capturing the component name and the path it's included from
+INCLUDE_RE = re.compile(
+    r"include(?: *{ *)([a-zA-Z\_0-9]*)(?: *as *)?(?:[a-zA-Z\_0-9]*)?(?: *})(?: *from *)(?:'|\")(.*)(?:'|\")"
+)
+
 
 def get_repo_info(directory, use_prompt=True):
     """
@@ -133,16 +137,10 @@ def get_components_to_install(subworkflow_dir):
     modules = []
     subworkflows = []
     with open(Path(subworkflow_dir, "main.nf"), "r") as fh:
-        for line in fh:
-            regex = re.compile(
-                r"include(?: *{ *)([a-zA-Z\_0-9]*)(?: *as *)?(?:[a-zA-Z\_0-9]*)?(?: *})(?: *from *)(?:'|\")(.*)(?:'|\")"
-            )
-            match = regex.match(line)
-            if match and len(match.groups()) == 2:
-                name, link = match.groups()
-                if link.startswith("../../../"):
-                    name_split = name.lower().split("_")
-                    modules.append("/".join(name_split))
-                elif link.startswith("../"):
-                    subworkflows.append(name.lower())
+        includes = [match.groups() for match in map(INCLUDE_RE.match, fh) if match]
+    for name, link in includes:
+        if link.startswith("../../../"):
+            modules.append(name.lower().replace("_", "/"))
+        elif link.startswith("../"):
+            subworkflows.append(name.lower())
     return modules, subworkflows
@@ -210,7 +210,7 @@ class ComponentInfo(ComponentCommand):
             dict or bool: Parsed meta.yml found, False otherwise
         """
         # Check if our requested module/subworkflow is there
-        if self.component not in self.modules_repo.get_avail_components(self.component_type):
+        if not self.modules_repo.component_exists(self.component, self.component_type):
             return False
 
         file_contents = self.modules_repo.get_meta_yml(self.component_type, self.component)
@@ -376,7 +376,7 @@ class ComponentUpdate(ComponentCommand):
             )
 
         # Check that the supplied name is an available module/subworkflow
-        if component and component not in self.modules_repo.get_avail_components(self.component_type, commit=self.sha):
+        if component and not self.modules_repo.component_exists(component, self.component_type, commit=self.sha):
             raise LookupError(
                 f"{self.component_type[:-1].title()} '{component}' not found in list of available {self.component_type}."
                 f"Use the command 'nf-core {self.component_type} list remote' to view available software"
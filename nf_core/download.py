@@ -10,6 +10,7 @@ import re
 import shutil
 import subprocess
 import tarfile
+import tempfile
 import textwrap
 from datetime import datetime
 from zipfile import ZipFile
@@ -591,10 +592,8 @@ class DownloadWorkflow:
         """Downloads workflow files from GitHub to the :attr:`self.outdir`."""
         log.debug(f"Downloading {download_url}")
 
-        # Download GitHub zip file into memory and extract
-        url = requests.get(download_url)
-        with ZipFile(io.BytesIO(url.content)) as zipfile:
-            zipfile.extractall(self.outdir)
+        # Download GitHub zip file and extract
+        self.download_and_extract_zip(download_url)
 
         # create a filesystem-safe version of the revision name for the directory
         revision_dirname = re.sub("[^0-9a-zA-Z]+", "_", revision)
@@ -619,10 +618,8 @@ class DownloadWorkflow:
         configs_local_dir = "configs-master"
         log.debug(f"Downloading {configs_zip_url}")
 
-        # Download GitHub zip file into memory and extract
-        url = requests.get(configs_zip_url)
-        with ZipFile(io.BytesIO(url.content)) as zipfile:
-            zipfile.extractall(self.outdir)
+        # Download GitHub zip file and extract
+        self.download_and_extract_zip(configs_zip_url)
 
         # Rename the internal directory name to be more friendly
         os.rename(os.path.join(self.outdir, configs_local_dir), os.path.join(self.outdir, "configs"))
@@ -632,6 +629,20 @@ class DownloadWorkflow:
             for fname in filelist:
                 os.chmod(os.path.join(dirpath, fname), 0o775)
 
+    def download_and_extract_zip(self, zip_url):
+        """Downloads a zip file to a temporary file on disk and extracts it to :attr:`self.outdir`.
+
+        The download is streamed in chunks, so that the archive is never held in memory.
+        """
+        with tempfile.TemporaryFile() as zip_fh:
+            # Disable caching as this breaks streamed downloads
+            with requests_cache.disabled():
+                with requests.get(zip_url, stream=True) as r:
+                    for data in r.iter_content(chunk_size=io.DEFAULT_BUFFER_SIZE):
+                        zip_fh.write(data)
+            with ZipFile(zip_fh) as zipfile:
+                zipfile.extractall(self.outdir)
+
     def wf_use_local_configs(self, revision_dirname):
         """Edit the downloaded nextflow.config file to use the local config files"""
         nfconfig_fn = os.path.join(self.outdir, revision_dirname, "nextflow.config")
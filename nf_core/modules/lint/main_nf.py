@@ -2,6 +2,8 @@
 Lint the main.nf file of a module
 """
 
+import concurrent.futures
+import functools
 import logging
 import re
 import sqlite3
@@ -9,6 +11,7 @@ from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
 import requests
+import requests_cache
 
 import nf_core
 import nf_core.modules.modules_utils
@@ -16,6 +19,32 @@ from nf_core.modules.modules_differ import ModulesDiffer
 
 log = logging.getLogger(__name__)
 
+# Cached session shared by all container URL checks, so that connections to the
+# container registries are kept alive between modules. Created on first use.
+container_session = None
+
+
+def get_container_session():
+    """
+    Return the session used to connect to container registries, creating it if needed
+    """
+    global container_session
+    if container_session is None:
+        container_session = requests_cache.CachedSession(
+            **nf_core.utils.setup_requests_cachedir(),
+            # Container images are never changed once published, so their URLs can be cached indefinitely
+            urls_expire_after={
+                "depot.galaxyproject.org/singularity/*": requests_cache.NEVER_EXPIRE,
+                "quay.io/biocontainers/*": requests_cache.NEVER_EXPIRE,
+            },
+            # Fall back to the cached response if the registry is unreachable
+            stale_if_error=True,
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        container_session.mount("https://", adapter)
+        container_session.mount("http://", adapter)
+    return container_session
+
 
 def main_nf(module_lint_object, module, fix_version, registry, progress_bar):
     """
@@ -234,6 +263,7 @@ def check_process_section(self, lines, registry, fix_version, progress_bar):
     singularity_tag = None
     docker_tag = None
     bioconda_packages = []
+    container_urls = []
 
     # Process name should be all capital letters
     self.process_name = lines[0].split()[1]
@@ -342,31 +372,33 @@ def check_process_section(self, lines, registry, fix_version, progress_bar):
                     self.main_nf,
                 )
             )
-        # Try to connect to container URLs
-        if url is None:
-            continue
-        try:
-            container_url = "https://" + urlunparse(url) if not url.scheme == "https" else urlunparse(url)
-            response = requests.head(
-                container_url,
-                stream=True,
-                allow_redirects=True,
-            )
-            log.debug(
-                f"Connected to URL: {'https://' + urlunparse(url) if not url.scheme == 'https' else urlunparse(url)}, "
-                f"status_code: {response.status_code}"
-            )
-        except (requests.exceptions.RequestException, sqlite3.InterfaceError) as e:
-            log.debug(f"Unable to connect to url '{urlunparse(url)}' due to error: {e}")
-            self.failed.append(("container_links", "Unable to connect to container URL", self.main_nf))
-            continue
-        if not response.ok:
-            self.warned.append(
+        # Collect container URLs to connect to them all at once below,
+        # along with where their results go in the lists of failed and warned tests
+        if url is not None:
+            container_urls.append((url, len(self.failed), len(self.warned)))
+
+    # Try to connect to container URLs
+    # Create the shared session up front, so that the threads don't race to create it
+    connect = functools.partial(_connect_container_url, get_container_session())
+    urls = [url for url, _, _ in container_urls]
+    if len(urls) > 1:
+        # At most as many threads as the session keeps connections open
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(urls), 10)) as pool:
+            responses = list(pool.map(connect, urls))
+    else:
+        responses = [connect(url) for url in urls]
+    # Insert the results last to first, so that the positions of the earlier ones stay valid
+    for (_, failed_pos, warned_pos), response in reversed(list(zip(container_urls, responses))):
+        if response is None:
+            self.failed.insert(failed_pos, ("container_links", "Unable to connect to container URL", self.main_nf))
+        elif not response.ok:
+            self.warned.insert(
+                warned_pos,
                 (
                     "container_links",
                     f"Unable to connect to container registry, code:  {response.status_code}, url: {response.url}",
                     self.main_nf,
-                )
+                ),
             )
 
     # Check that all bioconda packages have build numbers
@@ -544,6 +576,30 @@ def _is_empty(line):
     return empty
 
 
+def _connect_container_url(session, url):
+    """Send a HEAD request to a container URL
+
+    Args:
+        session (requests.Session): The session to send the request with
+        url (urllib.parse.ParseResult): The container URL
+
+    Returns:
+        Optional[requests.Response]: The response, or None if the URL could not be reached
+    """
+    container_url = "https://" + urlunparse(url) if not url.scheme == "https" else urlunparse(url)
+    try:
+        response = session.head(
+            container_url,
+            stream=True,
+            allow_redirects=True,
+        )
+        log.debug(f"Connected to URL: {container_url}, status_code: {response.status_code}")
+    except (requests.exceptions.RequestException, sqlite3.InterfaceError) as e:
+        log.debug(f"Unable to connect to url '{urlunparse(url)}' due to error: {e}")
+        return None
+    return response
+
+
 def _fix_module_version(self, current_version, latest_version, singularity_tag, response):
     """Updates the module version
 
@@ -571,8 +627,9 @@ def _fix_module_version(self, current_version, latest_version, singularity_tag,
                 "(?:['\"])(.+)(?:['\"])", re.sub(rf"{singularity_tag}", f"{latest_version}--{build}", line)
             ).group(1)
             try:
-                response_new_container = requests.get(
-                    "https://" + new_url if not new_url.startswith("https://") else new_url, stream=True
+                # Only check that the container exists, so that the image isn't downloaded into the cache
+                response_new_container = get_container_session().head(
+                    "https://" + new_url if not new_url.startswith("https://") else new_url, allow_redirects=True
                 )
                 log.debug(
                     f"Connected to URL: {'https://' + new_url if not new_url.startswith('https://') else new_url}, "
@@ -1,7 +1,7 @@
-import filecmp
 import logging
 import os
 import shutil
+import time
 from pathlib import Path
 
 import git
@@ -21,6 +21,22 @@ NF_CORE_MODULES_NAME = "nf-core"
 NF_CORE_MODULES_REMOTE = "https://github.com/nf-core/modules.git"
 NF_CORE_MODULES_DEFAULT_BRANCH = "master"
 
+# Don't fetch a remote again if the local copy was fetched less than this many seconds ago.
+# Can be overridden with the NFCORE_MODULES_FETCH_TTL environment variable, eg. set to 0 to always fetch.
+NF_CORE_MODULES_FETCH_TTL = 300
+
+
+def get_fetch_ttl():
+    """
+    Get the number of seconds for which a fetch of a modules remote is reused,
+    from the NFCORE_MODULES_FETCH_TTL environment variable if set
+    """
+    try:
+        return int(os.environ.get("NFCORE_MODULES_FETCH_TTL", NF_CORE_MODULES_FETCH_TTL))
+    except ValueError:
+        log.warning(f"NFCORE_MODULES_FETCH_TTL must be a number of seconds, using {NF_CORE_MODULES_FETCH_TTL}")
+        return NF_CORE_MODULES_FETCH_TTL
+
 
 class ModulesRepo(SyncedRepo):
     """
@@ -109,6 +125,13 @@ class ModulesRepo(SyncedRepo):
 
                 if ModulesRepo.no_pull_global:
                     ModulesRepo.update_local_repo_status(self.fullname, True)
+                # Skip the fetch if an earlier nf-core command fetched the remote only moments ago
+                elif self.recently_fetched(branch):
+                    log.info(
+                        f"Using local copy of '{self.fullname}', pulled less than {get_fetch_ttl()} seconds ago. "
+                        "Set NFCORE_MODULES_FETCH_TTL=0 to always pull the latest changes."
+                    )
+                    ModulesRepo.update_local_repo_status(self.fullname, True)
                 # If the repo is already cloned, fetch the latest changes from the remote
                 if not ModulesRepo.local_repo_synced(self.fullname):
                     pbar = rich.progress.Progress(
@@ -141,3 +164,23 @@ class ModulesRepo(SyncedRepo):
                 self.setup_local_repo(remote, branch, hide_progress)
             else:
                 raise LookupError("Exiting due to error with local modules git repo")
+
+    def recently_fetched(self, branch=None):
+        """
+        Checks whether the local repository was fetched from the remote within the last
+        NFCORE_MODULES_FETCH_TTL seconds, based on the modification time of FETCH_HEAD.
+        A requested branch that is not yet known locally always needs a fetch.
+
+        Args:
+            branch (str): name of branch to use
+
+        Returns:
+            (bool): Whether the last fetch is recent enough to be reused
+        """
+        if branch is not None and branch not in [ref.remote_head for ref in self.repo.remotes.origin.refs]:
+            return False
+        fetch_head = Path(self.repo.git_dir, "FETCH_HEAD")
+        try:
+            return time.time() - fetch_head.stat().st_mtime < get_fetch_ttl()
+        except FileNotFoundError:
+            return False
@@ -26,7 +26,6 @@ import nf_core.utils
 from nf_core.components.components_command import ComponentCommand
 
 from ..lint_utils import run_prettier_on_file
-from .modules_repo import ModulesRepo
 
 log = logging.getLogger(__name__)
 
@@ -1,15 +1,13 @@
-import filecmp
 import logging
 import os
+import posixpath
 import shutil
 from pathlib import Path
 
 import git
-import rich
-import rich.progress
 from git.exc import GitCommandError
 
-from nf_core.utils import load_tools_config
+from nf_core.utils import file_git_sha, load_tools_config
 
 log = logging.getLogger(__name__)
 
@@ -63,6 +61,7 @@ class SyncedRepo:
 
     local_repo_statuses = {}
     no_pull_global = False
+    avail_components_cache = {}
 
     @staticmethod
     def local_repo_synced(repo_name):
@@ -232,7 +231,12 @@ class SyncedRepo:
         Returns:
             (bool): Whether the module/subworkflow exists in this branch of the repository
         """
-        return component_name in self.get_avail_components(component_type, checkout=checkout, commit=commit)
+        if checkout:
+            self.checkout_branch()
+        if commit is not None:
+            self.checkout(commit)
+        # Only look at the directory of the requested module/subworkflow instead of listing all of them
+        return os.path.isfile(os.path.join(self.get_component_dir(component_name, component_type), "main.nf"))
 
     def get_component_dir(self, component_name, component_type):
         """
@@ -261,26 +265,74 @@ class SyncedRepo:
         Returns:
             (bool): Whether the operation was successful or not
         """
-        # Check out the repository at the requested ref
+        # Look up the requested ref, without checking it out
         try:
-            self.checkout(commit)
-        except git.GitCommandError:
+            tree = self.repo.commit(commit).tree
+        except (git.BadName, git.BadObject, ValueError):
             return False
 
-        # Check if the module/subworkflow exists in the branch
-        if not self.component_exists(component_name, component_type, checkout=False):
+        # Check if the module/subworkflow exists at the requested ref
+        component_path = Path(self.get_component_dir(component_name, component_type)).relative_to(self.local_repo_dir)
+        try:
+            component_tree = tree / component_path.as_posix()
+            component_tree / "main.nf"
+        except KeyError:
             log.error(
                 f"The requested {component_type[:-1]} does not exists in the branch '{self.branch}' of {self.remote_url}'"
             )
             return False
 
-        # Copy the files from the repo to the install folder
-        shutil.copytree(self.get_component_dir(component_name, component_type), Path(install_dir, component_name))
-
-        # Switch back to the tip of the branch
-        self.checkout_branch()
+        # Write the files straight from the git objects to the install folder
+        install_path = Path(install_dir, component_name)
+        install_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.write_git_object(tree, component_tree, install_path)
+        except KeyError as e:
+            log.error(f"Could not install {component_type[:-1]} '{component_name}': {e.args[0]}")
+            # Don't leave a partly installed module/subworkflow behind
+            shutil.rmtree(install_path, ignore_errors=True)
+            return False
         return True
 
+    @staticmethod
+    def write_git_object(tree, obj, dest):
+        """
+        Write a git tree or blob to the given path, like a checkout followed by shutil.copytree would.
+        Symbolic links are followed, so their targets are copied in their place.
+
+        Args:
+            tree (git.Tree): The root tree of the commit, used to resolve symbolic links
+            obj (git.Tree or git.Blob): The git object to write
+            dest (Path): The path to write the object to
+
+        Raises:
+            KeyError: If a symbolic link points outside the repository or loops
+        """
+        # Symbolic links are stored as blobs containing the path to their target
+        seen_links = set()
+        while obj.mode == git.Blob.link_mode:
+            if obj.path in seen_links:
+                raise KeyError(f"Symbolic link loop at '{obj.path}'")
+            seen_links.add(obj.path)
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(obj.path), obj.data_stream.read().decode()))
+            try:
+                obj = tree / target
+            except KeyError:
+                raise KeyError(f"Symbolic link '{obj.path}' points to '{target}', which is not in the repository")
+
+        if obj.type == "tree":
+            dest.mkdir(exist_ok=True)
+            for child in obj:
+                SyncedRepo.write_git_object(tree, child, dest / child.name)
+        else:
+            with open(dest, "wb") as fh:
+                obj.stream_data(fh)
+            if obj.mode & 0o111:
+                # Respect the umask, as git does when checking out executable files
+                umask = os.umask(0)
+                os.umask(umask)
+                dest.chmod(0o777 & ~umask)
+
     def component_files_identical(self, component_name, base_path, commit, component_type):
         """
         Checks whether the module or subworkflow files in a pipeline are identical to the ones in the remote
@@ -291,20 +343,18 @@ class SyncedRepo:
         Returns:
             (bool): Whether the pipeline files are identical to the repo files
         """
-        if commit is None:
-            self.checkout_branch()
-        else:
-            self.checkout(commit)
+        # Compare the git object IDs of the files, so that we don't need to check out the commit
+        tree = self.repo.commit(self.branch if commit is None else commit).tree
         component_files = ["main.nf", "meta.yml"]
         files_identical = {file: True for file in component_files}
-        component_dir = self.get_component_dir(component_name, component_type)
+        component_dir = Path(self.get_component_dir(component_name, component_type)).relative_to(self.local_repo_dir)
         for file in component_files:
             try:
-                files_identical[file] = filecmp.cmp(os.path.join(component_dir, file), os.path.join(base_path, file))
-            except FileNotFoundError:
+                remote_sha = (tree / Path(component_dir, file).as_posix()).hexsha
+                files_identical[file] = remote_sha == file_git_sha(os.path.join(base_path, file))
+            except (KeyError, FileNotFoundError):
                 log.debug(f"Could not open file: {os.path.join(component_dir, file)}")
                 continue
-        self.checkout_branch()
         return files_identical
 
     def get_component_git_log(self, component_name, component_type, depth=None):
@@ -346,8 +396,12 @@ class SyncedRepo:
         """
         Verifies that a given commit sha exists on the branch
         """
-        self.checkout_branch()
-        return sha in (commit.hexsha for commit in self.repo.iter_commits())
+        # Look the commit up directly instead of walking the whole history of the branch
+        try:
+            commit = self.repo.commit(sha)
+            return commit.hexsha == sha and self.repo.is_ancestor(commit, self.branch)
+        except (git.BadName, git.BadObject, ValueError, GitCommandError):
+            return False
 
     def get_commit_info(self, sha):
         """
@@ -360,20 +414,22 @@ class SyncedRepo:
         Raises:
             LookupError: If the search for the commit fails
         """
-        self.checkout_branch()
-        for commit in self.repo.iter_commits():
-            if commit.hexsha == sha:
-                message = commit.message.partition("\n")[0]
-                date_obj = commit.committed_datetime
-                date = str(date_obj.date())
-                return message, date
-        raise LookupError(f"Commit '{sha}' not found in the '{self.remote_url}'")
+        if not self.sha_exists_on_branch(sha):
+            raise LookupError(f"Commit '{sha}' not found in the '{self.remote_url}'")
+        commit = self.repo.commit(sha)
+        message = commit.message.partition("\n")[0]
+        date_obj = commit.committed_datetime
+        date = str(date_obj.date())
+        return message, date
 
-    def get_avail_components(self, component_type, checkout=True, commit=None):
+    def get_avail_components(self, component_type, checkout=True, commit=None, refresh=False):
         """
         Gets the names of the modules/subworkflows in the repository. They are detected by
         checking which directories have a 'main.nf' file
 
+        The names are cached for each checked out commit for the rest of the session,
+        unless 'refresh' is set.
+
         Returns:
             ([ str ]): The module/subworkflow names
         """
@@ -386,13 +442,15 @@ class SyncedRepo:
             directory = self.modules_dir
         elif component_type == "subworkflows":
             directory = self.subworkflows_dir
-        # Module/Subworkflow directories are characterized by having a 'main.nf' file
-        avail_component_names = [
-            os.path.relpath(dirpath, start=directory)
-            for dirpath, _, file_names in os.walk(directory)
-            if "main.nf" in file_names
-        ]
-        return avail_component_names
+        cache_key = (directory, self.repo.head.commit.hexsha)
+        if refresh or cache_key not in SyncedRepo.avail_components_cache:
+            # Module/Subworkflow directories are characterized by having a 'main.nf' file
+            SyncedRepo.avail_components_cache[cache_key] = [
+                os.path.relpath(dirpath, start=directory)
+                for dirpath, _, file_names in os.walk(directory)
+                if "main.nf" in file_names
+            ]
+        return list(SyncedRepo.avail_components_cache[cache_key])
 
     def get_meta_yml(self, component_type, module_name):
         """
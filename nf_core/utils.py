@@ -428,7 +428,13 @@ class GitHub_API_Session(requests_cache.CachedSession):
     def __init__(self):  # pylint: disable=super-init-not-called
         self.auth_mode = None
         self.return_ok = [200, 201]
-        self.return_retry = [403]
+        self.return_retry = [403, 429]
+        # Server errors are only retried for GET requests, as a failed POST may still have gone through
+        self.return_retry_get = [502, 503]
+        self.retry_backoff_base = 1
+        self.retry_backoff_cap = 30
+        self.rate_limit_min_wait = 60
+        self.rate_limit_warning = 10
         self.has_init = False
 
     def lazy_init(self):
@@ -476,10 +482,11 @@ class GitHub_API_Session(requests_cache.CachedSession):
                 output = rich.markup.escape(f"{ex_type.__name__}: {ex_value}")
                 log.debug(f"Couldn't auto-auth with GitHub CLI auth from '{gh_cli_config_fn}': [red]{output}")
 
-        # Default auth if we have a GitHub Token (eg. GitHub Actions CI)
-        if os.environ.get("GITHUB_TOKEN") is not None and self.auth is None:
-            self.auth_mode = "Bearer token with GITHUB_TOKEN"
-            self.auth = BearerAuth(os.environ["GITHUB_TOKEN"])
+        # Default auth if we have a GitHub Token (eg. GitHub Actions CI, or the gh CLI's GH_TOKEN)
+        for token_var in ["GITHUB_TOKEN", "GH_TOKEN"]:
+            if os.environ.get(token_var) is not None and self.auth is None:
+                self.auth_mode = f"Bearer token with {token_var}"
+                self.auth = BearerAuth(os.environ[token_var])
 
         log.debug(f"Using GitHub auth: {self.auth_mode}")
 
@@ -515,54 +522,161 @@ class GitHub_API_Session(requests_cache.CachedSession):
             raise AssertionError(f"GitHub API PR failed - got return code {request.status_code} from {url}")
         return request
 
+    def safe_get_all(self, url, per_page=100):
+        """
+        Run GET requests for every page of a paginated GitHub API endpoint,
+        following the 'next' links, and return the items of all pages in one list.
+        Raises a nice exception with lots of logging if any request fails.
+        """
+        items = []
+        url = f"{url}?per_page={per_page}"
+        while url is not None:
+            request = self.safe_get(url)
+            items.extend(request.json())
+            url = request.links.get("next", {}).get("url")
+        return items
+
     def get(self, url, **kwargs):
         """
         Initialise the session if we haven't already, then call the superclass get method.
         """
         if not self.has_init:
             self.lazy_init()
-        return super().get(url, **kwargs)
+        request = super().get(url, **kwargs)
+        self.check_rate_limit(request)
+        return request
 
-    def request_retry(self, url, post_data=None):
+    def check_rate_limit(self, request):
+        """
+        Warn if we are about to run out of GitHub API requests, based on the rate limit headers
+        """
+        if getattr(request, "from_cache", False):
+            return
+        try:
+            remaining = int(request.headers["X-RateLimit-Remaining"])
+            reset = datetime.datetime.fromtimestamp(int(request.headers["X-RateLimit-Reset"]))
+        except (KeyError, ValueError):
+            return
+        if remaining < self.rate_limit_warning:
+            warning = f"Only {remaining} GitHub API requests left until {reset:%H:%M:%S}."
+            if self.auth is None:
+                warning += " Set the GITHUB_TOKEN environment variable or log in with the gh CLI to raise the limit."
+            log.warning(warning)
+
+    def request_retry(self, url, post_data=None, max_tries=10):
         """
-        Try to fetch a URL, keep retrying if we get a certain return code.
+        Try to fetch a URL, keep retrying if we get a certain return code or can't connect.
 
         Used in nf-core sync code because we get 403 errors: too many simultaneous requests
         See https://github.com/nf-core/tools/issues/911
+
+        GET requests are also retried after server errors or if we can't connect. POST requests
+        are not, as GitHub may already have acted on them (eg. created the pull request).
+
+        Waits for as long as the 'Retry-After' header asks for, or until the rate limit resets.
+        Otherwise backs off exponentially with jitter, waiting at least a minute after
+        a rate limit error as GitHub asks. Gives up after 'max_tries' attempts.
+
+        Raises:
+            GitHubAPIError: If the request fails with an unexpected return code, or keeps failing
         """
         if not self.has_init:
             self.lazy_init()
 
+        return_retry = self.return_retry if post_data is not None else self.return_retry + self.return_retry_get
+
         # Start the loop for a retry mechanism
-        while True:
-            # GET request
-            if post_data is None:
-                log.debug(f"Seding GET request to {url}")
-                r = self.get(url=url)
-            # POST request
-            else:
-                log.debug(f"Seding POST request to {url}")
-                r = self.post(url=url, json=post_data)
+        for attempt in range(max_tries):
+            try:
+                # GET request
+                if post_data is None:
+                    log.debug(f"Sending GET request to {url}")
+                    r = self.get(url=url)
+                # POST request
+                else:
+                    log.debug(f"Sending POST request to {url}")
+                    r = self.post(url=url, json=post_data)
+            except requests.exceptions.ConnectionError as e:
+                if post_data is not None:
+                    raise
+                log.debug(f"Could not connect to {url}: {e}")
+                r = None
 
-            # Failed but expected - try again
-            if r.status_code in self.return_retry:
-                self.log_content_headers(r, post_data)
-                log.debug(f"GitHub API PR failed - got return code {r.status_code}")
-                wait_time = float(re.sub("[^0-9]", "", str(r.headers.get("Retry-After", 0))))
-                if wait_time == 0:
-                    log.debug("Couldn't find 'Retry-After' header, guessing a length of time to wait")
-                    wait_time = random.randrange(10, 60)
-                log.warning(f"Got API return code {r.status_code}. Trying again after {wait_time} seconds..")
-                time.sleep(wait_time)
+            # Success!
+            if r is not None and r.status_code in self.return_ok:
+                return r
 
             # Unexpected error - raise
-            elif r.status_code not in self.return_ok:
+            if r is not None and r.status_code not in return_retry:
                 self.log_content_headers(r, post_data)
-                raise RuntimeError(f"GitHub API PR failed - got return code {r.status_code} from {url}")
+                raise GitHubAPIError(
+                    f"GitHub API PR failed - got return code {r.status_code} from {url}", status_code=r.status_code
+                )
 
-            # Success!
+            # Failed but expected - try again
+            if r is None:
+                failure = "Could not connect to the API"
             else:
-                return r
+                self.log_content_headers(r, post_data)
+                failure = f"Got API return code {r.status_code}"
+                log.debug(f"GitHub API PR failed - got return code {r.status_code}")
+            if attempt == max_tries - 1:
+                break
+            wait_time = self.retry_wait_time(r, attempt)
+            log.warning(f"{failure}. Trying again after {wait_time:.1f} seconds..")
+            time.sleep(wait_time)
+
+        raise GitHubAPIError(
+            f"GitHub API request to {url} still failing after {max_tries} attempts",
+            status_code=r.status_code if r is not None else None,
+            retry_after=self.parse_retry_after(r),
+        )
+
+    @staticmethod
+    def parse_retry_after(request):
+        """
+        Return the number of seconds that the 'Retry-After' header asks us to wait, or None if not set
+        """
+        if request is None:
+            return None
+        try:
+            return int(request.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+
+    def retry_wait_time(self, request, attempt):
+        """
+        Work out how many seconds to wait before retrying a failed request.
+
+        Uses the 'Retry-After' header if set, or else the rate limit reset time if no requests
+        are left. Otherwise backs off exponentially with jitter. Rate limit errors (403, 429)
+        wait for at least 'rate_limit_min_wait' seconds, as asked for in the GitHub API docs.
+        """
+        retry_after = self.parse_retry_after(request)
+        if retry_after is not None:
+            return retry_after
+        if request is not None and request.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                return max(int(request.headers["X-RateLimit-Reset"]) - time.time(), 0) + 1
+            except (KeyError, ValueError):
+                pass
+        log.debug("Couldn't find 'Retry-After' header, backing off exponentially")
+        wait_time = random.uniform(0, min(self.retry_backoff_cap, self.retry_backoff_base * 2**attempt))
+        if request is not None and request.status_code in [403, 429]:
+            wait_time += self.rate_limit_min_wait
+        return wait_time
+
+
+class GitHubAPIError(RuntimeError):
+    """Exception raised when a GitHub API request fails, or keeps failing after retrying.
+
+    The return code and the 'Retry-After' time requested by GitHub (if any) are kept,
+    so that callers can decide whether to try again later."""
+
+    def __init__(self, message, status_code=None, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 # Single session object to use for entire codebase. Not sure if there's a better way to do this?
@@ -933,33 +1047,27 @@ def get_repo_releases_branches(pipeline, wfs):
                 f"Pipeline '{pipeline}' not in nf-core, but looks like a GitHub address - fetching releases from API"
             )
 
-            # Get releases from GitHub API
-            rel_r = gh_api.safe_get(f"https://api.github.com/repos/{pipeline}/releases")
-
-            # Check that this repo existed
-            try:
-                if rel_r.json().get("message") == "Not Found":
-                    raise AssertionError(f"Not able to find pipeline '{pipeline}'")
-            except AttributeError:
-                # Success! We have a list, which doesn't work with .get() which is looking for a dict key
-                wf_releases = list(sorted(rel_r.json(), key=lambda k: k.get("published_at_timestamp", 0), reverse=True))
-
-                # Get release tag commit hashes
-                if len(wf_releases) > 0:
-                    # Get commit hash information for each release
-                    tags_r = gh_api.safe_get(f"https://api.github.com/repos/{pipeline}/tags")
-                    for tag in tags_r.json():
-                        for release in wf_releases:
-                            if tag["name"] == release["tag_name"]:
-                                release["tag_sha"] = tag["commit"]["sha"]
+            # Get releases from GitHub API (raises an AssertionError if the repo doesn't exist)
+            releases = gh_api.safe_get_all(f"https://api.github.com/repos/{pipeline}/releases")
+            wf_releases = list(sorted(releases, key=lambda k: k.get("published_at_timestamp", 0), reverse=True))
+
+            # Get release tag commit hashes
+            if len(wf_releases) > 0:
+                # Get commit hash information for each release, indexing the tags by name
+                tag_shas = {
+                    tag["name"]: tag["commit"]["sha"]
+                    for tag in gh_api.safe_get_all(f"https://api.github.com/repos/{pipeline}/tags")
+                }
+                for release in wf_releases:
+                    if release["tag_name"] in tag_shas:
+                        release["tag_sha"] = tag_shas[release["tag_name"]]
 
         else:
             log.info("Available nf-core pipelines: '{}'".format("', '".join([w.name for w in wfs.remote_workflows])))
             raise AssertionError(f"Not able to find pipeline '{pipeline}'")
 
     # Get branch information from github api - should be no need to check if the repo exists again
-    branch_response = gh_api.safe_get(f"https://api.github.com/repos/{pipeline}/branches")
-    for branch in branch_response.json():
+    for branch in gh_api.safe_get_all(f"https://api.github.com/repos/{pipeline}/branches"):
         if (
             branch["name"] != "TEMPLATE"
             and branch["name"] != "initial_commit"
@@ -1098,6 +1206,24 @@ def file_md5(fname):
     return hash_md5.hexdigest()
 
 
+def file_git_sha(fname):
+    """Calculates the git blob SHA for a file on the disk.
+
+    This is the object ID that git would give the file contents,
+    so it can be compared directly to the entries of a git tree.
+
+    Args:
+        fname (str): Path to a local file.
+    """
+    hash_sha1 = hashlib.sha1()
+    hash_sha1.update(f"blob {os.path.getsize(fname)}\0".encode())
+    with open(fname, "rb") as f:
+        for chunk in iter(lambda: f.read(io.DEFAULT_BUFFER_SIZE), b""):
+            hash_sha1.update(chunk)
+
+    return hash_sha1.hexdigest()
+
+
 def validate_file_md5(file_name, expected_md5hex):
     """Validates the md5 checksum of a file on disk.
 
@@ -1,7 +1,9 @@
 import os
 from pathlib import Path
+from unittest import mock
 
 import pytest
+import requests
 
 import nf_core.modules
 from nf_core.modules.lint import main_nf
@@ -231,3 +233,47 @@ def test_modules_lint_check_process_labels(self):
         assert len(mocked_ModuleLint.passed) == passed
         assert len(mocked_ModuleLint.warned) == warned
         assert len(mocked_ModuleLint.failed) == failed
+
+
+PROCESS_CONTAINERS = """process FOO {
+    label 'process_single'
+
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/foo:1.0--0' :
+        'quay.io/biocontainers/foo:1.0--0' }"
+"""
+
+
+def test_modules_lint_check_process_section_container_links(self):
+    """Check that the results of the container URL checks are reported in the same order as the other tests"""
+    not_found = requests.Response()
+    not_found.status_code = 404
+    not_found.url = "https://quay.io/biocontainers/foo:1.0--0"
+
+    def mock_connect(session, url):
+        return None if url.netloc == "depot.galaxyproject.org" else not_found
+
+    mocked_ModuleLint = MockModuleLint()
+    with mock.patch("nf_core.modules.lint.main_nf.get_container_session"), mock.patch(
+        "nf_core.modules.lint.main_nf._connect_container_url", side_effect=mock_connect
+    ):
+        main_nf.check_process_section(mocked_ModuleLint, PROCESS_CONTAINERS.splitlines(), "quay.io", False, None)
+
+    failed_links = [message for test, message, _ in mocked_ModuleLint.failed if test == "container_links"]
+    assert failed_links[0] == "Unable to connect to container URL"
+    assert failed_links[1].startswith("quay.io/biocontainers/foo:1.0--0 container name found")
+    warned_links = [message for test, message, _ in mocked_ModuleLint.warned if test == "container_links"]
+    assert f"Unable to connect to container registry, code:  404, url: {not_found.url}" in warned_links
+
+
+def test_modules_lint_check_process_section_single_container(self):
+    """Check that a single container URL is checked without starting a thread pool"""
+    process = PROCESS_CONTAINERS.replace("'quay.io/biocontainers/foo:1.0--0'", "''")
+    mocked_ModuleLint = MockModuleLint()
+    with mock.patch("nf_core.modules.lint.main_nf.get_container_session"), mock.patch(
+        "nf_core.modules.lint.main_nf._connect_container_url", return_value=None
+    ) as mock_connect, mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_pool:
+        main_nf.check_process_section(mocked_ModuleLint, process.splitlines(), "quay.io", False, None)
+    assert mock_connect.call_count == 1
+    mock_pool.assert_not_called()
+    assert ("container_links", "Unable to connect to container URL", "main_nf") in mocked_ModuleLint.failed
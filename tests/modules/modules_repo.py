@@ -0,0 +1,30 @@
+import os
+import time
+from unittest import mock
+
+from nf_core.modules.modules_repo import NF_CORE_MODULES_FETCH_TTL
+
+from ..utils import create_local_modules_remote, get_local_modules_repo
+
+
+def test_modules_repo_recently_fetched(self):
+    """Test that a recent fetch is only reused for a branch that is known locally"""
+    remote = create_local_modules_remote(self.tmp_dir)
+    modules_repo = get_local_modules_repo(self.tmp_dir, remote)
+    assert modules_repo.recently_fetched()
+    assert modules_repo.recently_fetched("main")
+
+    # A branch created on the remote after the last fetch is fetched straight away
+    remote.create_head("new-branch")
+    assert not modules_repo.recently_fetched("new-branch")
+    assert get_local_modules_repo(self.tmp_dir, remote, branch="new-branch").branch == "new-branch"
+
+    # The fetch can be forced with an environment variable
+    with mock.patch.dict(os.environ, {"NFCORE_MODULES_FETCH_TTL": "0"}):
+        assert not modules_repo.recently_fetched("main")
+
+    # Backdate FETCH_HEAD to before the fetch TTL
+    fetch_head = os.path.join(modules_repo.repo.git_dir, "FETCH_HEAD")
+    old_mtime = time.time() - NF_CORE_MODULES_FETCH_TTL - 1
+    os.utime(fetch_head, (old_mtime, old_mtime))
+    assert not modules_repo.recently_fetched("main")
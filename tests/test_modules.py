@@ -174,6 +174,8 @@ class TestModules(unittest.TestCase):
     )
     from .modules.lint import (
         test_modules_lint_check_process_labels,
+        test_modules_lint_check_process_section_container_links,
+        test_modules_lint_check_process_section_single_container,
         test_modules_lint_empty,
         test_modules_lint_gitlab_modules,
         test_modules_lint_multiple_remotes,
@@ -204,6 +206,7 @@ class TestModules(unittest.TestCase):
         test_mod_json_with_empty_modules_value,
         test_mod_json_with_missing_modules_entry,
     )
+    from .modules.modules_repo import test_modules_repo_recently_fetched
     from .modules.modules_test import (
         test_modules_test_check_inputs,
         test_modules_test_no_installed_modules,
@@ -0,0 +1,79 @@
+""" Tests covering the local copies of modules repositories
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from nf_core.synced_repo import SyncedRepo
+
+from .utils import LOCAL_MODULES_ORG_PATH, create_local_modules_remote, get_local_modules_repo
+
+
+def commit_module_files(remote, files, message="Update foo module"):
+    """Write files (or symbolic links, given as Path objects) to the 'foo' module and commit them"""
+    module_dir = Path(remote.working_dir, "modules", LOCAL_MODULES_ORG_PATH, "foo")
+    for name, content in files.items():
+        path = module_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, Path):
+            os.symlink(content, path)
+        else:
+            path.write_text(content)
+    remote.git.add(all=True)
+    remote.git.commit(message=message)
+    return remote.head.commit
+
+
+def test_write_git_object(tmp_path):
+    remote = create_local_modules_remote(tmp_path)
+    org_dir = Path(remote.working_dir, "modules", LOCAL_MODULES_ORG_PATH)
+    (org_dir / "shared").mkdir()
+    (org_dir / "shared" / "shared.txt").write_text("shared\n")
+    (org_dir / "foo" / "bin").mkdir()
+    (org_dir / "foo" / "bin" / "run.sh").write_text("#!/bin/sh\n")
+    (org_dir / "foo" / "bin" / "run.sh").chmod(0o755)
+    commit = commit_module_files(remote, {"link.nf": Path("main.nf"), "shared": Path("../shared")})
+
+    umask = os.umask(0o027)
+    try:
+        SyncedRepo.write_git_object(
+            commit.tree, commit.tree / f"modules/{LOCAL_MODULES_ORG_PATH}/foo", tmp_path / "installed"
+        )
+    finally:
+        os.umask(umask)
+
+    installed = tmp_path / "installed"
+    # Symbolic links are replaced by a copy of their target
+    assert not (installed / "link.nf").is_symlink()
+    assert (installed / "link.nf").read_text() == "process FOO {}\n"
+    assert not (installed / "shared").is_symlink()
+    assert (installed / "shared" / "shared.txt").read_text() == "shared\n"
+    # Executable files respect the umask
+    assert (installed / "bin" / "run.sh").stat().st_mode & 0o777 == 0o750
+    assert (installed / "main.nf").stat().st_mode & 0o111 == 0
+
+
+@pytest.mark.parametrize(
+    "link_target",
+    [Path("../../../../outside.nf"), Path("/etc/hostname"), Path("loop.nf")],
+    ids=["outside", "absolute", "loop"],
+)
+def test_write_git_object_bad_link(tmp_path, link_target):
+    remote = create_local_modules_remote(tmp_path)
+    commit = commit_module_files(remote, {"loop.nf": link_target})
+    with pytest.raises(KeyError):
+        SyncedRepo.write_git_object(
+            commit.tree, commit.tree / f"modules/{LOCAL_MODULES_ORG_PATH}/foo", tmp_path / "installed"
+        )
+
+
+def test_install_component_bad_link_cleans_up(tmp_path):
+    remote = create_local_modules_remote(tmp_path)
+    commit = commit_module_files(remote, {"bad.nf": Path("../../../../outside.nf")})
+    modules_repo = get_local_modules_repo(tmp_path, remote)
+    install_dir = tmp_path / "pipeline" / "modules" / LOCAL_MODULES_ORG_PATH
+
+    assert not modules_repo.install_component("foo", install_dir, commit.hexsha, "modules")
+    assert not (install_dir / "foo").exists()
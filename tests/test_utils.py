@@ -1,9 +1,11 @@
 """ Tests covering for utility functions.
 """
 
+import json
 import os
 import shutil
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -207,3 +209,145 @@ def test_validate_file_md5():
         nf_core.utils.validate_file_md5(test_file, different_md5)
     with pytest.raises(ValueError):
         nf_core.utils.validate_file_md5(test_file, non_hex_string)
+
+
+def test_file_git_sha():
+    # git hash-object test.txt = 9daeafb9864cf43055ae93beb0afd6c7d144bfa4
+    test_file = TEST_DATA_DIR / "test.txt"
+    assert nf_core.utils.file_git_sha(test_file) == "9daeafb9864cf43055ae93beb0afd6c7d144bfa4"
+
+
+def mock_gh_response(status_code, headers=None, json_data=None):
+    """Build a GitHub API response that has not come from the requests cache"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(json_data if json_data is not None else {}).encode()
+    response.from_cache = False
+    return response
+
+
+@mock.patch("time.sleep")
+def test_request_retry_then_success(mock_sleep):
+    gh_api = nf_core.utils.GitHub_API_Session()
+    gh_api.has_init = True
+    responses = [
+        requests.exceptions.ConnectionError(),
+        mock_gh_response(502),
+        mock_gh_response(429, {"Retry-After": "5"}),
+        mock_gh_response(403),
+        mock_gh_response(201),
+    ]
+    with mock.patch.object(gh_api, "get", side_effect=responses) as mock_get:
+        assert gh_api.request_retry("https://api.github.com/test").status_code == 201
+    assert mock_get.call_count == 5
+    wait_times = [call.args[0] for call in mock_sleep.call_args_list]
+    assert wait_times[0] <= gh_api.retry_backoff_base
+    assert wait_times[1] <= gh_api.retry_backoff_base * 2
+    assert wait_times[2] == 5
+    # Rate limit errors without a 'Retry-After' header wait at least a minute
+    assert wait_times[3] >= gh_api.rate_limit_min_wait
+
+
+@mock.patch("time.sleep")
+def test_request_retry_rate_limit_reset(mock_sleep):
+    gh_api = nf_core.utils.GitHub_API_Session()
+    gh_api.has_init = True
+    reset = int(time.time()) + 120
+    responses = [
+        mock_gh_response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}),
+        mock_gh_response(200),
+    ]
+    with mock.patch.object(gh_api, "get", side_effect=responses):
+        gh_api.request_retry("https://api.github.com/test")
+    assert 110 < mock_sleep.call_args.args[0] <= 121
+
+
+@mock.patch("time.sleep")
+def test_request_retry_exhausted(mock_sleep):
+    gh_api = nf_core.utils.GitHub_API_Session()
+    gh_api.has_init = True
+    with mock.patch.object(gh_api, "get", return_value=mock_gh_response(503, {"Retry-After": "7"})) as mock_get:
+        with pytest.raises(nf_core.utils.GitHubAPIError) as exc_info:
+            gh_api.request_retry("https://api.github.com/test", max_tries=3)
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.retry_after == 7
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@mock.patch("time.sleep")
+def test_request_retry_post_rate_limit_only(mock_sleep):
+    gh_api = nf_core.utils.GitHub_API_Session()
+    gh_api.has_init = True
+    # A POST is retried after a rate limit error
+    with mock.patch.object(gh_api, "post", side_effect=[mock_gh_response(403), mock_gh_response(201)]) as mock_post:
+        assert gh_api.request_retry("https://api.github.com/test", post_data={"title": "test"}).status_code == 201
+    assert mock_post.call_count == 2
+    # But not after a server error or connection error, as it may still have gone through
+    with mock.patch.object(gh_api, "post", return_value=mock_gh_response(502)) as mock_post:
+        with pytest.raises(nf_core.utils.GitHubAPIError) as exc_info:
+            gh_api.request_retry("https://api.github.com/test", post_data={"title": "test"})
+    assert exc_info.value.status_code == 502
+    assert mock_post.call_count == 1
+    with mock.patch.object(gh_api, "post", side_effect=requests.exceptions.ConnectionError()) as mock_post:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            gh_api.request_retry("https://api.github.com/test", post_data={"title": "test"})
+    assert mock_post.call_count == 1
+    assert mock_sleep.call_count == 1
+
+
+@mock.patch("time.sleep")
+def test_request_retry_unexpected_code(mock_sleep):
+    gh_api = nf_core.utils.GitHub_API_Session()
+    gh_api.has_init = True
+    with mock.patch.object(gh_api, "get", return_value=mock_gh_response(404)) as mock_get:
+        with pytest.raises(nf_core.utils.GitHubAPIError) as exc_info:
+            gh_api.request_retry("https://api.github.com/test")
+    assert exc_info.value.status_code == 404
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_safe_get_all_follows_next_links():
+    gh_api = nf_core.utils.GitHub_API_Session()
+    url = "https://api.github.com/repos/nf-core/tools/tags"
+    next_url = f"{url}?per_page=100&page=2"
+    pages = [
+        mock_gh_response(200, {"Link": f'<{next_url}>; rel="next", <{next_url}>; rel="last"'}, [{"name": "1.0"}]),
+        mock_gh_response(200, json_data=[{"name": "0.9"}, {"name": "0.8"}]),
+    ]
+    with mock.patch.object(gh_api, "safe_get", side_effect=pages) as mock_safe_get:
+        items = gh_api.safe_get_all(url)
+    assert items == [{"name": "1.0"}, {"name": "0.9"}, {"name": "0.8"}]
+    assert [call.args[0] for call in mock_safe_get.call_args_list] == [f"{url}?per_page=100", next_url]
+
+
+def test_check_rate_limit(caplog):
+    gh_api = nf_core.utils.GitHub_API_Session()
+    gh_api.auth = None
+    reset = str(int(time.time()) + 600)
+
+    # Plenty of requests left, or no rate limit headers
+    gh_api.check_rate_limit(mock_gh_response(200, {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": reset}))
+    gh_api.check_rate_limit(mock_gh_response(200))
+    assert caplog.records == []
+
+    # Responses from the cache don't count against the rate limit
+    cached_response = mock_gh_response(200, {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": reset})
+    cached_response.from_cache = True
+    gh_api.check_rate_limit(cached_response)
+    assert caplog.records == []
+
+    # Running low without auth suggests setting a token
+    low_response = mock_gh_response(200, {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": reset})
+    gh_api.check_rate_limit(low_response)
+    assert "Only 1 GitHub API requests left" in caplog.text
+    assert "GITHUB_TOKEN" in caplog.text
+
+    # Running low with auth doesn't
+    caplog.clear()
+    gh_api.auth = requests.auth.HTTPBasicAuth("nf-core", "token")
+    gh_api.check_rate_limit(low_response)
+    assert "Only 1 GitHub API requests left" in caplog.text
+    assert "GITHUB_TOKEN" not in caplog.text
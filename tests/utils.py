@@ -7,10 +7,13 @@ import os
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
+from unittest import mock
 
+import git
 import responses
 
 import nf_core.modules
+import nf_core.synced_repo
 
 OLD_TRIMGALORE_SHA = "9b7a3bdefeaad5d42324aa7dd50f87bea1b04386"
 OLD_TRIMGALORE_BRANCH = "mimic-old-trimgalore"
@@ -25,6 +28,9 @@ GITLAB_BRANCH_TEST_BRANCH = "branch-tester"
 GITLAB_BRANCH_ORG_PATH_BRANCH = "org-path"
 GITLAB_BRANCH_TEST_OLD_SHA = "e772abc22c1ff26afdf377845c323172fb3c19ca"
 GITLAB_BRANCH_TEST_NEW_SHA = "7d73e21f30041297ea44367f2b4fd4e045c0b991"
+# Local modules repo stuff
+LOCAL_MODULES_URL = "https://example.com/nf-core-test/modules.git"
+LOCAL_MODULES_ORG_PATH = "nf-core-test"
 
 
 def with_temporary_folder(func):
@@ -108,3 +114,39 @@ def mock_biocontainers_api_calls(rsps: responses.RequestsMock, module, version):
         ],
     }
     rsps.get(biocontainers_api_url, json=biocontainers_mock, status=200)
+
+
+def create_local_modules_remote(tmp_dir):
+    """
+    Create a git repository laid out like a modules repository, with a single 'foo' module,
+    that can be used as the remote of a ModulesRepo without any network access
+    """
+    remote_dir = Path(tmp_dir, "remote")
+    module_dir = remote_dir / "modules" / LOCAL_MODULES_ORG_PATH / "foo"
+    module_dir.mkdir(parents=True)
+    (remote_dir / ".nf-core.yml").write_text(f"repository_type: modules\norg_path: {LOCAL_MODULES_ORG_PATH}\n")
+    (module_dir / "main.nf").write_text("process FOO {}\n")
+    (module_dir / "meta.yml").write_text("name: foo\n")
+    remote = git.Repo.init(remote_dir, initial_branch="main")
+    with remote.config_writer() as config:
+        config.set_value("user", "name", "nf-core")
+        config.set_value("user", "email", "core@nf-co.re")
+    remote.git.add(all=True)
+    remote.git.commit(message="Add foo module")
+    return remote
+
+
+def get_local_modules_repo(tmp_dir, remote, branch=None):
+    """
+    Clone the remote created by create_local_modules_remote into a temporary nf-core
+    config directory, and return a ModulesRepo object for it
+    """
+    nfcore_dir = Path(tmp_dir, "nfcore")
+    local_repo_dir = nfcore_dir / nf_core.modules.modules_utils.repo_full_name_from_remote(LOCAL_MODULES_URL)
+    if not local_repo_dir.exists():
+        git.Repo.clone_from(remote.working_dir, local_repo_dir)
+    # Don't let the pull status of this repo leak into other tests
+    with mock.patch("nf_core.modules.modules_repo.NFCORE_DIR", str(nfcore_dir)), mock.patch.dict(
+        nf_core.synced_repo.SyncedRepo.local_repo_statuses
+    ):
+        return nf_core.modules.ModulesRepo(LOCAL_MODULES_URL, branch=branch, hide_progress=True)